@@ -98,9 +98,9 @@ class AutoAIStudioAIConnector {
         return array('error' => 'No response from AI model');
     }
     
-    public function generate_article($topic, $type = 'general', $word_count = 800, $sources = array()) {
+    public function generate_article($topic, $type = 'general', $word_count = 800, $sources = array(), $research = array()) {
         $system_message = $this->get_system_message($type);
-        $prompt = $this->build_content_prompt($topic, $type, $word_count, $sources);
+        $prompt = $this->build_content_prompt($topic, $type, $word_count, $sources, $research);
         
         $options = array(
             'temperature' => 0.4,
@@ -176,10 +176,19 @@ class AutoAIStudioAIConnector {
         return $messages[$type] ?? $messages['general'];
     }
     
-    private function build_content_prompt($topic, $type, $word_count, $sources = array()) {
+    private function build_content_prompt($topic, $type, $word_count, $sources = array(), $research = array()) {
         $prompt = "Write a {$word_count}-word {$type} article about: {$topic}\n\n";
         
-        if (!empty($sources)) {
+        // Prefer the researcher's token-budgeted context over pasting whole sources
+        if (!empty($research['context'])) {
+            $prompt .= "Use these research notes for reference (cite sources by their number):\n";
+            $prompt .= $research['context'] . "\n\n";
+            $prompt .= "Sources:\n";
+            foreach ($research['citations'] ?? array() as $citation) {
+                $prompt .= "[" . $citation['id'] . "] " . $citation['title'] . " (" . $citation['url'] . ")\n";
+            }
+            $prompt .= "\n";
+        } elseif (!empty($sources)) {
             $prompt .= "Use these sources for reference (cite them appropriately):\n";
             foreach ($sources as $source) {
                 $prompt .= "- " . $source['title'] . " (" . $source['url'] . ")\n";
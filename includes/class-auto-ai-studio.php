@@ -115,6 +115,8 @@ class AutoAIStudioCore {
             'ollama_host' => sanitize_text_field($post_data['ollama_host']),
             'model_name' => sanitize_text_field($post_data['model_name']),
             'python_path' => sanitize_text_field($post_data['python_path']),
+            'research_service_url' => esc_url_raw($post_data['research_service_url'] ?? ''),
+            'job_queue_path' => sanitize_text_field($post_data['job_queue_path'] ?? ''),
             'content_humanization' => isset($post_data['content_humanization']),
             'auto_publish' => isset($post_data['auto_publish']),
             'include_images' => isset($post_data['include_images']),
@@ -174,15 +176,134 @@ class AutoAIStudioCore {
     }
     
     public function process_campaigns() {
+        $queue_path = $this->settings['job_queue_path'] ?? '';
+        
+        // Record finished runs first so failed jobs are logged before they can be queued again
+        if (!empty($queue_path)) {
+            $this->collect_campaign_results($queue_path);
+        }
+        
         $active_campaigns = AutoAIStudioDatabase::get_campaigns('active');
         
         foreach ($active_campaigns as $campaign) {
             if ($this->should_run_campaign($campaign)) {
-                $this->run_campaign($campaign);
+                // With a job queue configured, article campaigns run in the Python worker pool
+                if (!empty($queue_path) && $campaign['type'] === 'general_articles') {
+                    $this->enqueue_campaign($campaign, $queue_path);
+                } else {
+                    $this->run_campaign($campaign);
+                }
+            }
+        }
+    }
+    
+    private function call_job_queue($command, $config) {
+        $python_path = $this->settings['python_path'] ?? '/usr/bin/python3';
+        $script_path = AUTO_AI_STUDIO_PLUGIN_DIR . 'python/job_queue.py';
+        
+        $shell_command = escapeshellcmd($python_path) . ' ' . escapeshellarg($script_path) . ' ' . escapeshellarg($command) . ' ' . escapeshellarg(json_encode($config));
+        $output = shell_exec($shell_command);
+        
+        if ($output) {
+            $result = json_decode($output, true);
+            if (json_last_error() === JSON_ERROR_NONE) {
+                return $result;
+            }
+        }
+        
+        return array('success' => false, 'error' => 'Job queue unavailable');
+    }
+    
+    private function enqueue_campaign($campaign, $queue_path) {
+        $settings = json_decode($campaign['settings'], true);
+        $keywords = explode(',', $campaign['keywords']);
+        $main_keyword = trim($keywords[0]);
+        
+        if (empty($main_keyword)) {
+            AutoAIStudioDatabase::log_campaign_activity($campaign['id'], 'error', 'No keywords provided');
+            return;
+        }
+        
+        $run = $campaign['last_run'] ?: 'never';
+        
+        $result = $this->call_job_queue('enqueue', array(
+            'queue_path' => $queue_path,
+            'stage' => 'research',
+            // Overlapping cron runs see the same last_run, so they cannot queue the same run twice
+            'idempotency_key' => 'campaign-' . $campaign['id'] . '-' . $run,
+            'priority' => intval($settings['priority'] ?? 0),
+            'payload' => array(
+                'campaign_id' => $campaign['id'],
+                'last_run' => $run,
+                'topic' => $main_keyword,
+                'article_type' => $settings['article_type'] ?? 'standard',
+                'word_count' => $settings['word_count'] ?? 800,
+                'humanize' => $settings['enable_humanization'] ?? false
+            )
+        ));
+        
+        if (!$result['success']) {
+            AutoAIStudioDatabase::log_campaign_activity($campaign['id'], 'error', 'Failed to queue campaign: ' . $result['error']);
+        } elseif ($result['created']) {
+            AutoAIStudioDatabase::log_campaign_activity($campaign['id'], 'queued', 'Campaign queued as job #' . $result['job_id']);
+        }
+    }
+    
+    private function collect_campaign_results($queue_path) {
+        $result = $this->call_job_queue('collect', array(
+            'queue_path' => $queue_path,
+            'stages' => array('generate')
+        ));
+        
+        if (!$result['success']) {
+            return;
+        }
+        
+        $content_generator = new AutoAIStudioContentGenerator();
+        
+        // Collected jobs are handed out again unless acknowledged, so a cron run that
+        // dies before saving does not lose the article
+        foreach ($result['jobs'] as $job) {
+            $campaign = AutoAIStudioDatabase::get_campaign($job['payload']['campaign_id']);
+            
+            // A moved last_run means this run was already saved before its acknowledgement was lost
+            if (!$campaign || ($campaign['last_run'] ?: 'never') !== ($job['payload']['last_run'] ?? 'never')) {
+                $this->ack_job($queue_path, $job['id']);
+                continue;
+            }
+            
+            if ($job['status'] !== 'done') {
+                AutoAIStudioDatabase::log_campaign_activity($campaign['id'], 'error', $job['error']);
+                $this->ack_job($queue_path, $job['id']);
+                continue;
+            }
+            
+            $save_result = $content_generator->save_generated_article($campaign, $job['result']);
+            
+            if ($save_result['success']) {
+                AutoAIStudioDatabase::update_campaign_last_run($campaign['id']);
+                AutoAIStudioDatabase::log_campaign_activity($campaign['id'], 'success', 'Content generated successfully');
+                $this->ack_job($queue_path, $job['id']);
+            } else {
+                AutoAIStudioDatabase::log_campaign_activity($campaign['id'], 'error', $save_result['message']);
+                // last_run stays put, so release the run's idempotency key for the next cron run;
+                // if this call fails too, the job is collected and retried after the timeout
+                $this->call_job_queue('fail', array(
+                    'queue_path' => $queue_path,
+                    'job_id' => $job['id'],
+                    'error' => $save_result['message']
+                ));
             }
         }
     }
     
+    private function ack_job($queue_path, $job_id) {
+        $this->call_job_queue('ack', array(
+            'queue_path' => $queue_path,
+            'job_ids' => array($job_id)
+        ));
+    }
+    
     private function should_run_campaign($campaign) {
         $last_run = $campaign['last_run'];
         $frequency = json_decode($campaign['settings'], true)['frequency'] ?? 'hourly';
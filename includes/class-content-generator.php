@@ -58,7 +58,8 @@ class AutoAIStudioContentGenerator {
             $main_keyword,
             $article_type,
             $word_count,
-            $research_data['sources'] ?? array()
+            $research_data['sources'] ?? array(),
+            $research_data
         );
         
         if (!$content_result['success']) {
@@ -88,18 +89,31 @@ class AutoAIStudioContentGenerator {
             }
         }
         
+        return $this->save_generated_article($campaign, array(
+            'title' => $selected_title,
+            'content' => $content,
+            'meta_description' => $meta_description,
+            'keywords' => $extracted_keywords,
+            'sources' => $research_data['sources'] ?? array()
+        ));
+    }
+    
+    public function save_generated_article($campaign, $article) {
+        $settings = json_decode($campaign['settings'], true);
+        $content = $article['content'];
+        
         // Check content quality
         $quality_check = $this->ai_connector->check_content_quality($content);
         
         // Save generated content
         $content_data = array(
             'campaign_id' => $campaign['id'],
-            'title' => $selected_title,
+            'title' => $article['title'],
             'content' => $content,
-            'meta_description' => $meta_description,
-            'keywords' => $extracted_keywords,
-            'sources' => json_encode($research_data['sources'] ?? array()),
-            'ai_model' => $this->settings['model_name'] ?? 'llama3:8b',
+            'meta_description' => $article['meta_description'],
+            'keywords' => $article['keywords'],
+            'sources' => json_encode($article['sources'] ?? array()),
+            'ai_model' => $article['model'] ?? ($this->settings['model_name'] ?? 'llama3:8b'),
             'word_count' => str_word_count(strip_tags($content)),
             'status' => 'draft',
             'humanization_score' => $quality_check['score'] ?? 0,
@@ -199,13 +213,34 @@ class AutoAIStudioContentGenerator {
     }
     
     private function research_topic($topic, $settings) {
+        // Prefer the long-running research service when one is configured
+        $service_url = $this->settings['research_service_url'] ?? '';
+        if (!empty($service_url)) {
+            $response = wp_remote_post(rtrim($service_url, '/') . '/research', array(
+                'body' => json_encode(array('topic' => $topic, 'deadline' => 180)),
+                'headers' => array(
+                    'Content-Type' => 'application/json',
+                ),
+                'timeout' => 190,
+                'data_format' => 'body'
+            ));
+            
+            if (!is_wp_error($response) && wp_remote_retrieve_response_code($response) === 200) {
+                $research_data = json_decode(wp_remote_retrieve_body($response), true);
+                if (json_last_error() === JSON_ERROR_NONE && !empty($research_data['success'])) {
+                    return $research_data;
+                }
+            }
+        }
+        
         // Call Python research script if available
         $python_path = $this->settings['python_path'] ?? '/usr/bin/python3';
         $script_path = AUTO_AI_STUDIO_PLUGIN_DIR . 'python/content_researcher.py';
         
         if (file_exists($script_path)) {
             $command = escapeshellcmd($python_path) . ' ' . escapeshellarg($script_path) . ' ' . escapeshellarg($topic);
-            $output = shell_exec($command . ' 2>&1');
+            // Only stdout carries JSON; stderr diagnostics stay in the server log
+            $output = shell_exec($command);
             
             if ($output) {
                 $research_data = json_decode($output, true);
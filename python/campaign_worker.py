@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Auto AI Studio Campaign Worker
+Worker pool running the research -> generation pipeline from the job queue
+"""
+
+import os
+import sys
+import socket
+import logging
+import argparse
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+from job_queue import JobQueue
+from ollama_client import OllamaClient
+from response_cache import ResponseCache
+
+logger = logging.getLogger('auto_ai_studio.campaign_worker')
+
+RESEARCH_STAGE = 'research'
+GENERATE_STAGE = 'generate'
+
+
+def _default_researcher():
+    from content_researcher import IntelligentContentResearcher
+    return IntelligentContentResearcher()
+
+
+class CampaignWorkerPool:
+    """
+    Each worker leases whichever stage is ready next, so research for one
+    campaign overlaps with generation for another
+    """
+
+    def __init__(self, queue: JobQueue, workers: int = 4,
+                 researcher_factory: Callable[[], Any] = _default_researcher,
+                 client_factory: Callable[[], OllamaClient] = OllamaClient,
+                 lease_seconds: float = 600.0, poll_interval: float = 5.0):
+        self.queue = queue
+        self.workers = max(1, workers)
+        self.researcher_factory = researcher_factory
+        self.client_factory = client_factory
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.handlers = {RESEARCH_STAGE: self._research, GENERATE_STAGE: self._generate}
+        self.worker_prefix = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+        self._local = threading.local()
+
+    def _researcher(self):
+        if not hasattr(self._local, 'researcher'):
+            self._local.researcher = self.researcher_factory()
+        return self._local.researcher
+
+    def _client(self) -> OllamaClient:
+        if not hasattr(self._local, 'client'):
+            self._local.client = self.client_factory()
+        return self._local.client
+
+    def _research(self, job: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict]]:
+        payload = job['payload']
+        research = self._researcher().research_topic(
+            payload['topic'],
+            max_sources=payload.get('max_sources', 5),
+            context_tokens=payload.get('context_tokens', 800)
+        )
+        if not research.get('success'):
+            # Same as the PHP path: a failed research step still produces an article, just unsourced
+            logger.warning("Research failed for campaign %s: %s", payload.get('campaign_id'), research.get('error'))
+            research = {'sources': []}
+
+        next_jobs = [{
+            'stage': GENERATE_STAGE,
+            'payload': {**payload, 'research': research},
+            'idempotency_key': f"{job['idempotency_key']}:{GENERATE_STAGE}" if job['idempotency_key'] else None,
+            'priority': job['priority']
+        }]
+        return {'sources_found': len(research.get('sources', []))}, next_jobs
+
+    def _generate(self, job: Dict[str, Any]) -> Tuple[Dict[str, Any], List[Dict]]:
+        payload = job['payload']
+        research = payload.get('research') or {}
+        article_type = payload.get('article_type', 'standard')
+        client = self._client()
+
+        article = client.generate_article(
+            payload['topic'], article_type, payload.get('word_count', 800),
+            research.get('sources', []), research
+        )
+        if not article['success']:
+            raise RuntimeError('Failed to generate content: ' + article.get('error', 'Unknown error'))
+
+        extras = client.generate_article_extras(article['content'], article_type, humanize=payload.get('humanize', False))
+        humanized = extras.get('humanized') or {}
+        meta = extras['meta_description']
+        keywords = extras['keywords']
+
+        return {
+            'campaign_id': payload.get('campaign_id'),
+            'title': extras['title'] or payload['topic'] + ' - Complete Guide',
+            'content': humanized['content'] if humanized.get('success') else article['content'],
+            'meta_description': meta['content'].strip() if meta['success'] else '',
+            'keywords': keywords['content'].strip() if keywords['success'] else '',
+            'sources': research.get('sources', []),
+            'model': article['model'],
+            'tokens_per_second': article['tokens_per_second']
+        }, []
+
+    def _run_job(self, worker_id: str, job: Dict[str, Any]) -> None:
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(self.lease_seconds / 3):
+                if not self.queue.heartbeat(job['id'], worker_id, self.lease_seconds):
+                    logger.warning("Lost lease on job %s", job['id'])
+                    return
+
+        keeper = threading.Thread(target=heartbeat, daemon=True)
+        keeper.start()
+        try:
+            result, next_jobs = self.handlers[job['stage']](job)
+            self.queue.complete(job['id'], worker_id, result, next_jobs)
+        except Exception as e:
+            logger.exception("Job %s (%s) failed on attempt %s", job['id'], job['stage'], job['attempts'])
+            self.queue.fail(job['id'], worker_id, str(e))
+        finally:
+            done.set()
+            keeper.join()
+
+    def _worker_loop(self, index: int, drain: bool) -> None:
+        worker_id = f"{self.worker_prefix}:{index}"
+        while not self._stop.is_set():
+            job = self.queue.lease(worker_id, list(self.handlers), self.lease_seconds)
+            if not job:
+                if drain:
+                    return
+                self._stop.wait(self.poll_interval)
+                continue
+            self._run_job(worker_id, job)
+
+    def run(self, drain: bool = False) -> None:
+        """Process jobs until stop() is called, or until the queue is empty when drain is set"""
+        threads = [
+            threading.Thread(target=self._worker_loop, args=(i, drain), name=f"campaign-worker-{i}")
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def main():
+    """Main function for command line usage"""
+    parser = argparse.ArgumentParser(description='Auto AI Studio campaign worker pool')
+    parser.add_argument('--queue', required=True, help='Path to the SQLite job queue')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--ollama-host', default='http://localhost:11434')
+    parser.add_argument('--model', default='llama3:8b')
+    parser.add_argument('--max-parallel', type=int, default=4, help="Ollama's OLLAMA_NUM_PARALLEL")
+    parser.add_argument('--cache-path', help='Persist the generation response cache here')
+    parser.add_argument('--drain', action='store_true', help='Exit once the queue is empty')
+    args = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO, format='%(asctime)s %(levelname)s %(threadName)s %(message)s')
+
+    # One cache and one Ollama parallelism budget shared by every worker thread
+    cache = ResponseCache(path=args.cache_path) if args.cache_path else None
+    client = OllamaClient(host=args.ollama_host, model=args.model, max_parallel=args.max_parallel, cache=cache)
+
+    pool = CampaignWorkerPool(JobQueue(args.queue), workers=args.workers, client_factory=lambda: client)
+    try:
+        pool.run(drain=args.drain)
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,18 +4,32 @@
 # pip install requests beautifulsoup4 newspaper3k ddgs spacy semanticscholar
 # python -m spacy download en_core_web_md
 
+import os
 import sys
+import atexit
 import json
 import requests
 import time
 import re
+import codecs
+import sqlite3
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from itertools import islice
 from datetime import datetime, timezone
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Optional, Any
+import numpy as np
 from bs4 import BeautifulSoup
 from ddgs import DDGS
-import spacy
 from semanticscholar import SemanticScholar
 
+from ranking import assess_credibility
+from paper_cache import PaperCache, DEFAULT_PATH as PAPER_CACHE_PATH
+from vector_store import load_nlp
+
 try:
     from urllib.parse import urlparse
 except ImportError:
@@ -27,16 +41,211 @@ try:
 except ImportError:
     NEWSPAPER_AVAILABLE = False
 
-# Load the upgraded spaCy NLP model with word vectors
 try:
-    NLP = spacy.load("en_core_web_md")
+    import lxml.html
+    from lxml.etree import ParserError
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Load the upgraded spaCy NLP model, with its word vectors mapped from a table shared across processes
+try:
+    NLP = load_nlp("en_core_web_md")
 except OSError:
     print("spaCy model 'en_core_web_md' not found.", file=sys.stderr)
     print("Please run: python -m spacy download en_core_web_md", file=sys.stderr)
     NLP = None
 
+
+def _relevance(topic_doc: Any, content_doc: Any) -> float:
+    """Vector similarity between topic and content plus a bonus for shared entities"""
+    if not content_doc or not content_doc.has_vector or content_doc.vector_norm == 0:
+        return 0.0
+    
+    similarity = topic_doc.similarity(content_doc)
+    
+    topic_ents = {ent.text.lower(): ent.label_ for ent in topic_doc.ents}
+    content_ents = {ent.text.lower(): ent.label_ for ent in content_doc.ents}
+    
+    entity_bonus = 0.0
+    for topic_ent, topic_label in topic_ents.items():
+        if topic_ent in content_ents and content_ents[topic_ent] == topic_label:
+            entity_bonus += 0.2
+    
+    return min(similarity + entity_bonus, 1.0)
+
+
+def _doc_features(doc: Any) -> Dict[str, Any]:
+    """What _relevance needs from a document, in a form that can be pickled and cached"""
+    has_vector = doc.has_vector and doc.vector_norm != 0
+    return {
+        'vector': np.array(doc.vector, dtype='float32') if has_vector else None,
+        'vector_norm': float(doc.vector_norm) if has_vector else 0.0,
+        'ents': {ent.text.lower(): ent.label_ for ent in doc.ents}
+    }
+
+
+def _relevance_from_features(topic_doc: Any, features: Optional[Dict[str, Any]]) -> float:
+    """_relevance computed from cached document features instead of a parsed Doc"""
+    if not features or features['vector'] is None or not topic_doc.vector_norm:
+        return 0.0
+    
+    similarity = float(np.dot(topic_doc.vector, features['vector']) / (topic_doc.vector_norm * features['vector_norm']))
+    
+    entity_bonus = 0.0
+    for ent in topic_doc.ents:
+        if features['ents'].get(ent.text.lower()) == ent.label_:
+            entity_bonus += 0.2
+    
+    return min(similarity + entity_bonus, 1.0)
+
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def count_tokens(text: str) -> int:
+    """Conservative LLM token count: one per punctuation mark, one per started 8 characters of a word"""
+    return sum(1 + (len(piece) - 1) // 8 for piece in _TOKEN_RE.findall(text))
+
+
+def _codec(name: Optional[str]) -> str:
+    """Python codec for a declared charset, falling back to utf-8 for unknown names"""
+    try:
+        return codecs.lookup(name or 'utf-8').name
+    except LookupError:
+        return 'utf-8'
+
+
+@lru_cache(maxsize=8)
+def _topic_doc(topic: str) -> Any:
+    return NLP(topic)
+
+
+def _score_texts(topic: str, texts: List[str]) -> List[float]:
+    """Pool worker entry point: score texts against a topic with this process's model"""
+    topic_doc = _topic_doc(topic)
+    return [_relevance(topic_doc, doc) for doc in NLP.pipe(texts)]
+
+
+def _texts_features(texts: List[str]) -> List[Dict[str, Any]]:
+    """Pool worker entry point: vector and entity features for each text"""
+    return [_doc_features(doc) for doc in NLP.pipe(texts)]
+
+
+class NLPScoringPool:
+    """
+    Fans relevance scoring out to worker processes that each hold a loaded spaCy model.
+    Safe to share between threads; workers is the total number of processes.
+    """
+    
+    def __init__(self, workers: int, max_attempts: int = 2):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self._executor = None
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # Forking after the model is loaded shares it copy-on-write; spawned
+                # workers (Windows/macOS) load it once on import instead
+                methods = multiprocessing.get_all_start_methods()
+                if threading.active_count() > 1 and 'forkserver' in methods:
+                    # Forking a threaded host (research service, campaign workers) can copy locks
+                    # other threads hold mid-update; fork from a single-threaded server instead,
+                    # which imports this module, and so loads the model, once for all workers
+                    if __name__ != '__main__':
+                        multiprocessing.set_forkserver_preload([__name__])
+                    context = multiprocessing.get_context('forkserver')
+                else:
+                    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+                self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+            return self._executor
+    
+    def _reset(self, executor: Optional[ProcessPoolExecutor]):
+        # Only the first thread to see a broken executor replaces it
+        with self._lock:
+            if executor is None or executor is not self._executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+    
+    def score(self, topic: str, texts: List[str]) -> List[float]:
+        """Score texts in parallel; texts a crashed worker never scored get 0.0"""
+        return [score if score is not None else 0.0 for score in self._map(_score_texts, texts, topic)]
+    
+    def features(self, texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Document features in parallel; None for texts a crashed worker never parsed"""
+        return self._map(_texts_features, texts)
+    
+    def _map(self, fn: Callable, texts: List[str], *args) -> List[Any]:
+        results: List[Any] = [None] * len(texts)
+        chunk_size = max(1, len(texts) // (self.workers * 4))
+        
+        for _ in range(self.max_attempts):
+            pending = [i for i, result in enumerate(results) if result is None]
+            if not pending:
+                break
+            futures = {}
+            executor = None
+            try:
+                executor = self._get_executor()
+                for start in range(0, len(pending), chunk_size):
+                    indexes = pending[start:start + chunk_size]
+                    futures[executor.submit(fn, *args, [texts[i] for i in indexes])] = indexes
+            except (BrokenProcessPool, RuntimeError, OSError) as e:
+                print(f"NLP Pool Error: {e}", file=sys.stderr)
+                self._reset(executor)
+            
+            broken = None
+            for future, indexes in futures.items():
+                try:
+                    for i, result in zip(indexes, future.result()):
+                        results[i] = result
+                except BrokenProcessPool as e:
+                    broken = e
+                except Exception as e:
+                    print(f"NLP Worker Error: {e}", file=sys.stderr)
+            if broken:
+                # One dead worker breaks the whole executor; retry on a fresh one
+                print(f"NLP Worker Crashed: {broken}", file=sys.stderr)
+                self._reset(executor)
+        
+        return results
+    
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_scoring_pool(workers: int) -> NLPScoringPool:
+    """
+    The process-wide scoring pool. Hosts that run a researcher per thread (research
+    service, campaign workers) share its processes; the first caller sets the size.
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = NLPScoringPool(workers)
+            atexit.register(_shared_pool.close)
+        return _shared_pool
+
+
 class IntelligentContentResearcher:
-    def __init__(self):
+    # Only what the academic strategy uses; the default field set is several times larger
+    S2_FIELDS = ['paperId', 'title', 'abstract', 'url', 'publicationDate']
+    # Web fast path: bytes read per candidate before deciding whether newspaper3k is worth running
+    PREVIEW_BYTES = 64 * 1024
+    PREVIEW_THRESHOLD = 0.4
+    
+    def __init__(self, nlp_workers: Optional[int] = None, paper_cache_path: Optional[str] = PAPER_CACHE_PATH,
+                 s2_max_pages: int = 3, nlp_pool: Optional[NLPScoringPool] = None):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
@@ -47,8 +256,27 @@ class IntelligentContentResearcher:
             {"name": "BBC News", "url": "https://feeds.bbci.co.uk/news/rss.xml", "credibility": 4.8},
         ]
         self.s2 = SemanticScholar()
+        self.s2_max_pages = s2_max_pages
+        
+        self.paper_cache = None
+        if paper_cache_path and NLP:
+            try:
+                self.paper_cache = PaperCache(paper_cache_path, model=f"{NLP.meta['name']}-{NLP.meta['version']}")
+            except (OSError, sqlite3.Error) as e:
+                print(f"Paper Cache Error: {e}", file=sys.stderr)
+        
+        if nlp_pool is None:
+            if nlp_workers is None:
+                nlp_workers = int(os.environ.get('AUTO_AI_STUDIO_NLP_WORKERS', '0') or 0)
+            nlp_pool = shared_scoring_pool(nlp_workers) if nlp_workers > 1 else None
+        self.nlp_pool = nlp_pool
+    
+    def close(self):
+        # The scoring pool is shared with other researchers and shuts down at exit
+        if self.paper_cache:
+            self.paper_cache.close()
 
-    def research_topic(self, topic: str, max_sources: int = 5) -> Dict[str, Any]:
+    def research_topic(self, topic: str, max_sources: int = 5, context_tokens: int = 800) -> Dict[str, Any]:
         if not NLP:
             return {"success": False, "error": "spaCy model not loaded. Cannot perform research.", "topic": topic}
         
@@ -71,9 +299,12 @@ class IntelligentContentResearcher:
                 source['final_score'] = self._calculate_final_score(source)
             
             ranked_sources = sorted(diverse_sources, key=lambda x: x['final_score'], reverse=True)
+            context = self._build_context(topic_doc, ranked_sources[:max_sources], context_tokens)
             
             return {
                 "success": True, "topic": topic, "sources": ranked_sources[:max_sources],
+                "context": context['context'], "citations": context['citations'],
+                "context_tokens": context['context_tokens'],
                 "analysis": self._analyze_sources(topic, ranked_sources),
                 "timestamp": datetime.now().isoformat()
             }
@@ -101,97 +332,305 @@ class IntelligentContentResearcher:
         return 1.0 - (days_old / 30.0)
 
     def _calculate_relevance_score(self, topic_doc: Any, content_doc: Any) -> float:
-        if not content_doc or not content_doc.has_vector or content_doc.vector_norm == 0:
-            return 0.0
+        return _relevance(topic_doc, content_doc)
+    
+    def _score_texts(self, topic_doc: Any, texts: List[str]) -> List[float]:
+        """Relevance of each text to the topic, using the process pool when configured"""
+        if not texts:
+            return []
+        if self.nlp_pool:
+            return self.nlp_pool.score(topic_doc.text, texts)
+        return [self._calculate_relevance_score(topic_doc, doc) for doc in NLP.pipe(texts)]
+    
+    def _preview_web_source(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Stream the head and first PREVIEW_BYTES of a page and pull out its title,
+        meta description and main text. Returns None for pages that cannot be articles.
+        A page longer than the preview keeps its stream open in 'response', so the
+        rest can be read later without downloading the start again.
+        """
+        try:
+            response = self.session.get(url, stream=True, timeout=15)
+        except requests.exceptions.RequestException:
+            return None
         
-        similarity = topic_doc.similarity(content_doc)
+        preview = None
+        try:
+            if response.status_code >= 400: return None
+            content_type = response.headers.get('Content-Type', '').lower()
+            if content_type and 'html' not in content_type: return None
+            
+            body, complete = b'', True
+            for chunk in response.iter_content(16384):
+                body += chunk
+                if len(body) >= self.PREVIEW_BYTES:
+                    complete = False
+                    break
+            encoding = _codec(response.encoding) if 'charset=' in content_type else 'utf-8'
+            preview = self._parse_preview(url, body, complete, encoding)
+            if preview and not complete:
+                preview.update({'response': response, 'body': body, 'encoding': encoding})
+            return preview
+        except requests.exceptions.RequestException:
+            return None
+        finally:
+            if not preview or preview['complete']:
+                response.close()
+    
+    def _parse_preview(self, url: str, body: bytes, complete: bool, encoding: str) -> Optional[Dict[str, Any]]:
+        """Title, description and main text from the preview bytes"""
+        try:
+            doc = lxml.html.document_fromstring(body)
+        except (ParserError, ValueError):
+            return None
+        
+        def first(xpath: str) -> str:
+            values = doc.xpath(xpath)
+            return ' '.join(str(values[0]).split()) if values else ''
         
-        topic_ents = {ent.text.lower(): ent.label_ for ent in topic_doc.ents}
-        content_ents = {ent.text.lower(): ent.label_ for ent in content_doc.ents}
+        title = first('//meta[@property="og:title"]/@content') or first('//title/text()')
+        description = first('//meta[@name="description"]/@content') or first('//meta[@property="og:description"]/@content')
         
-        entity_bonus = 0.0
-        for topic_ent, topic_label in topic_ents.items():
-            if topic_ent in content_ents and content_ents[topic_ent] == topic_label:
-                entity_bonus += 0.2
+        for element in doc.xpath('//script|//style|//noscript|//nav|//header|//footer|//aside|//form'):
+            element.drop_tree()
         
-        return min(similarity + entity_bonus, 1.0)
+        # Main text: the container holding the most paragraph text
+        blocks = {}
+        for paragraph in doc.iter('p'):
+            text = ' '.join(paragraph.text_content().split())
+            if len(text) >= 40:
+                blocks.setdefault(paragraph.getparent(), []).append(text)
+        main_text = ' '.join(max(blocks.values(), key=lambda texts: sum(map(len, texts)))) if blocks else ''
+        
+        return {
+            'url': url, 'title': title, 'description': description, 'main_text': main_text,
+            # All visible text bounds the article length, but only once the whole page was read
+            'page_words': len(doc.text_content().split()), 'complete': complete,
+            'html': body.decode(encoding, errors='replace') if complete else None,
+            'response': None
+        }
+    
+    def _release_preview(self, preview: Dict[str, Any]) -> None:
+        response = preview.get('response')
+        if response is not None:
+            response.close()
+            preview['response'] = None
     
-    def _process_web_source(self, url: str, topic_doc: Any) -> Optional[Dict[str, Any]]:
+    def _page_html(self, preview: Dict[str, Any]) -> Optional[str]:
+        """
+        Whole page for a preview that passed: already in hand for short pages, otherwise
+        the preview bytes plus the rest of the still-open stream. None leaves the
+        download to newspaper3k.
+        """
+        response = preview.get('response')
+        if response is None:
+            return preview['html']
+        try:
+            body = preview['body'] + b''.join(response.iter_content(65536))
+            return body.decode(preview['encoding'], errors='replace')
+        except requests.exceptions.RequestException:
+            return None
+        finally:
+            self._release_preview(preview)
+    
+    def _prefilter_web_sources(self, topic_doc: Any, urls: List[str]) -> List[Dict[str, Any]]:
+        """Cheap previews of each URL, dropping pages that are too short or clearly off-topic"""
+        if not LXML_AVAILABLE:
+            return [{'url': url, 'html': None, 'response': None} for url in urls]
+        
+        previews = []
+        for url in urls:
+            try:
+                preview = self._preview_web_source(url)
+            except Exception as e:
+                # One malformed page should only cost its own candidacy
+                print(f"Web Preview Error: {url}: {e}", file=sys.stderr)
+                continue
+            if not preview: continue
+            if not preview['title'] or (preview['complete'] and preview['page_words'] < 100):
+                self._release_preview(preview)
+                continue
+            previews.append(preview)
+        
+        kept = []
+        try:
+            texts = [f"{p['title']}\n{p['description']}\n{p['main_text'][:500]}" for p in previews]
+            kept = [
+                preview for preview, relevance in zip(previews, self._score_texts(topic_doc, texts))
+                if relevance >= self.PREVIEW_THRESHOLD
+            ]
+            return kept
+        finally:
+            for preview in previews:
+                if not any(preview is k for k in kept):
+                    self._release_preview(preview)
+    
+    def _fetch_web_source(self, url: str, html: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Download (unless the page is already in hand) and parse an article, returning None if it is unusable"""
         try:
             if not NEWSPAPER_AVAILABLE: return None
             article = Article(url)
-            article.download()
+            article.download(input_html=html)
             article.parse()
 
             title = article.title
             content = article.text
-            pub_date = article.publish_date
 
             if not title or len(content.split()) < 100: return None
             
-            content_doc = NLP(f"{title}\n{content[:2000]}")
-            # Lowered threshold slightly to be less strict
-            relevance = self._calculate_relevance_score(topic_doc, content_doc)
-            if relevance < 0.55: return None
-            
-            return {
-                'url': url, 'title': title, 'content': content,
-                'snippet': content[:400], 'domain': urlparse(url).netloc,
-                'published_date': pub_date.isoformat() if pub_date else None,
-                'credibility_score': self._assess_credibility(urlparse(url).netloc),
-                'relevance_score': relevance,
-                'recency_score': self._get_recency_score(pub_date),
-                'strategy': 'web_search'
-            }
+            return {'url': url, 'title': title, 'content': content, 'published': article.publish_date}
         except (ArticleException, requests.exceptions.RequestException):
             return None
-
+    
+    def _build_web_source(self, candidate: Dict[str, Any], relevance: float) -> Optional[Dict[str, Any]]:
+        # Lowered threshold slightly to be less strict
+        if relevance < 0.55: return None
+        
+        url, content, pub_date = candidate['url'], candidate['content'], candidate['published']
+        return {
+            'url': url, 'title': candidate['title'], 'content': content,
+            'snippet': content[:400], 'domain': urlparse(url).netloc,
+            'published_date': pub_date.isoformat() if pub_date else None,
+            'credibility_score': self._assess_credibility(urlparse(url).netloc),
+            'relevance_score': relevance,
+            'recency_score': self._get_recency_score(pub_date),
+            'strategy': 'web_search'
+        }
+    
     def _ddg_web_search(self, topic_doc: Any, max_results: int) -> List[Dict[str, Any]]:
-        sources = []
+        urls = []
         try:
             with DDGS() as ddgs:
                 for result in ddgs.text(f'"{topic_doc.text}"', region='wt-wt', max_results=max_results + 5):
-                    if len(sources) >= max_results: break
                     url = result.get('href')
-                    if url:
-                        source = self._process_web_source(url, topic_doc)
-                        if source: sources.append(source)
+                    if url: urls.append(url)
         except Exception as e:
             print(f"DDGS Search Error: {e}", file=sys.stderr)
+        
+        # Only pages that survive the cheap preview get the full newspaper3k parse
+        previews = passed = self._prefilter_web_sources(topic_doc, urls)
+        sources = []
+        try:
+            while previews and len(sources) < max_results:
+                # Parse just enough pages to cover the shortfall, scoring each batch at once
+                # so the NLP pool can spread it over cores
+                shortfall = max_results - len(sources)
+                batch, previews = previews[:shortfall], previews[shortfall:]
+                candidates = []
+                try:
+                    for preview in batch:
+                        candidate = self._fetch_web_source(preview['url'], self._page_html(preview))
+                        if candidate: candidates.append(candidate)
+                except Exception as e:
+                    print(f"Web Fetch Error: {e}", file=sys.stderr)
+                    previews = []
+                
+                texts = [f"{c['title']}\n{c['content'][:2000]}" for c in candidates]
+                for candidate, relevance in zip(candidates, self._score_texts(topic_doc, texts)):
+                    source = self._build_web_source(candidate, relevance)
+                    if source: sources.append(source)
+        finally:
+            # Pages never parsed still hold their preview streams open
+            for preview in passed:
+                self._release_preview(preview)
         return sources
         
+    def _text_features(self, texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        if not texts:
+            return []
+        if self.nlp_pool:
+            return self.nlp_pool.features(texts)
+        return [_doc_features(doc) for doc in NLP.pipe(texts)]
+    
+    def _paper_records(self, papers: List[Any]) -> List[Dict[str, Any]]:
+        """Metadata plus abstract features per paper, parsing only papers missing from the cache"""
+        cached = self.paper_cache.get_papers([p.paperId for p in papers if p.paperId]) if self.paper_cache else {}
+        
+        records, fresh = [], []
+        for paper in papers:
+            if paper.paperId in cached:
+                records.append(cached[paper.paperId])
+                continue
+            pub_date = paper.publicationDate
+            record = {
+                'paperId': paper.paperId, 'title': paper.title, 'abstract': paper.abstract or "",
+                'url': paper.url,
+                'publicationDate': pub_date.strftime('%Y-%m-%d') if isinstance(pub_date, datetime) else pub_date
+            }
+            records.append(record)
+            fresh.append(record)
+        
+        features = self._text_features([f"{r['title']}. {r['abstract']}" for r in fresh])
+        for record, feature in zip(fresh, features):
+            record.update(feature or {'vector': None, 'vector_norm': 0.0, 'ents': {}})
+        if self.paper_cache and fresh:
+            self.paper_cache.put_papers([r for r, f in zip(fresh, features) if f and r['paperId']])
+        return records
+    
+    def _semantic_scholar_pages(self, query: str, page_size: int):
+        """Yield pages of paper records; the client only fetches the next page when asked"""
+        results = self.s2.search_paper(query=query, fields=self.S2_FIELDS, limit=page_size)
+        page = []
+        # islice stops before asking for an item past the last allowed page, which would fetch one more
+        for paper in islice(results, page_size * self.s2_max_pages):
+            page.append(paper)
+            if len(page) == page_size:
+                yield self._paper_records(page)
+                page = []
+        if page:
+            yield self._paper_records(page)
+    
     def _semantic_scholar_search(self, topic_doc: Any, max_results: int) -> List[Dict[str, Any]]:
         sources = []
         try:
-            results = self.s2.search_paper(query=topic_doc.text, limit=max_results)
-            for paper in results:
-                pub_date = paper.publicationDate
-                dt_object = None
-                
-                # FIX: Check if pub_date is a string before parsing, otherwise use it directly.
-                if isinstance(pub_date, str):
-                    dt_object = datetime.strptime(pub_date, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-                elif isinstance(pub_date, datetime):
-                    dt_object = pub_date.replace(tzinfo=timezone.utc)
-
-                # FIX: Ensure content is not null
-                content_text = paper.abstract or ""
-                content = f"{paper.title}. {content_text}"
-                content_doc = NLP(content)
-                relevance = self._calculate_relevance_score(topic_doc, content_doc)
-                if relevance > 0.6:
-                    sources.append({
-                        'url': paper.url, 'title': paper.title, 'content': content_text, 
-                        'snippet': content_text[:400], 'domain': 'semanticscholar.org',
-                        'published_date': dt_object.isoformat() if dt_object else None,
-                        'credibility_score': 4.5,
-                        'relevance_score': relevance,
-                        'recency_score': self._get_recency_score(dt_object),
-                        'strategy': 'academic_search'
-                    })
+            query = topic_doc.text
+            cached_ids = self.paper_cache.get_query(query) if self.paper_cache else None
+            if cached_ids is not None:
+                cached = self.paper_cache.get_papers(cached_ids)
+                # A result list is only usable while every paper it names is still cached
+                if len(cached) < len(set(cached_ids)):
+                    cached_ids = None
+            if cached_ids is not None:
+                pages = [[cached[paper_id] for paper_id in cached_ids]]
+            else:
+                pages = self._semantic_scholar_pages(query, min(100, max(10, max_results * 5)))
+            
+            scanned = []
+            for page in pages:
+                for paper in page:
+                    if paper['paperId']:
+                        scanned.append(paper['paperId'])
+                    relevance = _relevance_from_features(topic_doc, paper)
+                    if relevance > 0.6:
+                        sources.append(self._build_paper_source(paper, relevance))
+                # Stop paging as soon as enough papers pass the threshold
+                if len(sources) >= max_results:
+                    break
+            
+            if cached_ids is None and self.paper_cache:
+                self.paper_cache.put_query(query, scanned)
         except Exception as e:
             print(f"Semantic Scholar Error: {e}", file=sys.stderr)
-        return sources
+        return sources[:max_results]
+    
+    def _build_paper_source(self, paper: Dict[str, Any], relevance: float) -> Dict[str, Any]:
+        dt_object = None
+        try:
+            if paper['publicationDate']:
+                dt_object = datetime.strptime(paper['publicationDate'], '%Y-%m-%d').replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+        
+        content_text = paper['abstract']
+        return {
+            'url': paper['url'], 'title': paper['title'], 'content': content_text,
+            'snippet': content_text[:400], 'domain': 'semanticscholar.org',
+            'published_date': dt_object.isoformat() if dt_object else None,
+            'credibility_score': 4.5,
+            'relevance_score': relevance,
+            'recency_score': self._get_recency_score(dt_object),
+            'strategy': 'academic_search'
+        }
 
     def _ensure_source_diversity(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         unique_sources = {}
@@ -201,12 +640,57 @@ class IntelligentContentResearcher:
         return list(unique_sources.values())
 
     def _assess_credibility(self, domain: str) -> float:
-        domain = domain.lower()
-        if any(d in domain for d in ['reuters.com', 'apnews.com', 'bbc.com']): return 5.0
-        if any(d in domain for d in ['nytimes.com', 'wsj.com', 'npr.org']): return 4.5
-        if 'semanticscholar.org' in domain or '.edu' in domain: return 4.5
-        if '.gov' in domain: return 4.8
-        return 3.0
+        return assess_credibility(domain)
+
+    def _build_context(self, topic_doc: Any, sources: List[Dict[str, Any]], token_budget: int,
+                       token_counter: Callable[[str], int] = count_tokens,
+                       duplicate_similarity: float = 0.95) -> Dict[str, Any]:
+        """
+        Pack the most topic-relevant sentences across sources into token_budget tokens.
+        Each line is prefixed with its citation number; near-duplicate sentences are kept once.
+        """
+        if not sources or not topic_doc.has_vector or topic_doc.vector_norm == 0:
+            return {'context': '', 'citations': [], 'context_tokens': 0}
+        topic_unit = topic_doc.vector / topic_doc.vector_norm
+        
+        candidates = []
+        texts = [(s.get('content') or s.get('snippet') or '')[:10000] for s in sources]
+        for source_index, doc in enumerate(NLP.pipe(texts)):
+            for position, sent in enumerate(doc.sents):
+                text = ' '.join(sent.text.split())
+                if len(text.split()) < 6 or not sent.has_vector or sent.vector_norm == 0:
+                    continue
+                unit = sent.vector / sent.vector_norm
+                candidates.append((float(unit @ topic_unit), source_index, position, text, unit))
+        candidates.sort(key=lambda c: c[0], reverse=True)
+        
+        selected, seen, used = [], set(), 0
+        for score, source_index, position, text, unit in candidates:
+            key = re.sub(r'\W+', ' ', text.lower()).strip()
+            if key in seen or any(float(unit @ other[4]) >= duplicate_similarity for other in selected):
+                continue
+            # The citation number is one token however many digits it has
+            cost = token_counter(f"[0] {text}")
+            if used + cost > token_budget:
+                continue
+            seen.add(key)
+            selected.append((source_index, position, text, cost, unit))
+            used += cost
+        
+        # Number cited sources in ranking order and keep each source's sentences in reading order
+        cited = sorted({source_index for source_index, *_ in selected})
+        numbers = {source_index: n for n, source_index in enumerate(cited, 1)}
+        lines = [f"[{numbers[source_index]}] {text}" for source_index, position, text, *_ in sorted(selected)]
+        
+        return {
+            'context': '\n'.join(lines),
+            'citations': [
+                {'id': numbers[i], 'title': sources[i].get('title', ''), 'url': sources[i].get('url', ''),
+                 'domain': sources[i].get('domain', '')}
+                for i in cited
+            ],
+            'context_tokens': used
+        }
 
     def _analyze_sources(self, topic: str, sources: List[Dict[str, Any]]) -> Dict[str, Any]:
         if not sources: return {"summary": f"No relevant sources found for topic: {topic}"}
@@ -232,6 +716,7 @@ def main():
     topic = " ".join(sys.argv[1:])
     researcher = IntelligentContentResearcher()
     result = researcher.research_topic(topic, max_sources=5)
+    researcher.close()
     print(json.dumps(result, indent=2, default=str))
 
 
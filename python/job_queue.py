@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Auto AI Studio Job Queue
+SQLite-backed job queue with leases, idempotency keys, priorities and retries
+"""
+
+import sys
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    stage TEXT NOT NULL,
+    idempotency_key TEXT UNIQUE,
+    parent_id INTEGER,
+    priority INTEGER NOT NULL DEFAULT 0,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_until REAL,
+    result TEXT,
+    error TEXT,
+    collected INTEGER NOT NULL DEFAULT 0,
+    collect_until REAL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (status, priority DESC, available_at);
+"""
+
+
+class JobQueue:
+    """
+    Jobs move queued -> leased -> done | failed. A lease that expires without
+    complete() or fail() makes the job available again, so a crashed worker's
+    job is retried until max_attempts is used up. A job that fails for good also
+    fails the upstream stages that queued it, so the whole chain can be
+    submitted again under its original idempotency key.
+
+    Collecting a finished job is a lease too: the caller acknowledges it with ack()
+    or fail_chain() once the result is stored, and a job not acknowledged within
+    collect_timeout is handed out again.
+    """
+
+    def __init__(self, path: str, retry_delay: float = 30.0, collect_timeout: float = 600.0):
+        self.path = path
+        self.retry_delay = retry_delay
+        self.collect_timeout = collect_timeout
+        self._local = threading.local()
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; sqlite serialises writers through BEGIN IMMEDIATE
+        if not hasattr(self._local, 'db'):
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.row_factory = sqlite3.Row
+            db.execute('PRAGMA journal_mode=WAL')
+            self._local.db = db
+        return self._local.db
+
+    @contextmanager
+    def _transaction(self):
+        db = self._connection()
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            yield db
+        except BaseException:
+            db.execute('ROLLBACK')
+            raise
+        db.execute('COMMIT')
+
+    def _insert(self, db: sqlite3.Connection, stage: str, payload: Dict, idempotency_key: Optional[str],
+                priority: int, max_attempts: int, delay: float, parent_id: Optional[int] = None) -> Tuple[int, bool]:
+        now = time.time()
+        cursor = db.execute(
+            'INSERT OR IGNORE INTO jobs (stage, idempotency_key, parent_id, priority, payload, max_attempts, available_at, '
+            'created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (stage, idempotency_key, parent_id, priority, json.dumps(payload), max_attempts, now + delay, now, now)
+        )
+        if cursor.rowcount:
+            return cursor.lastrowid, True
+        row = db.execute('SELECT id, status FROM jobs WHERE idempotency_key = ?', (idempotency_key,)).fetchone()
+        if row['status'] != 'failed':
+            return row['id'], False
+        # A failed job may be submitted again under the same key
+        db.execute(
+            "UPDATE jobs SET stage = ?, parent_id = ?, priority = ?, payload = ?, status = 'queued', attempts = 0, "
+            "max_attempts = ?, available_at = ?, lease_owner = NULL, lease_until = NULL, result = NULL, error = NULL, "
+            "collected = 0, collect_until = NULL, updated_at = ? WHERE id = ?",
+            (stage, parent_id, priority, json.dumps(payload), max_attempts, now + delay, now, row['id'])
+        )
+        return row['id'], True
+
+    def _fail_upstream(self, db: sqlite3.Connection, job_id: int, error: str, now: float) -> None:
+        # The failure is reported once, through the job that failed, so ancestors are marked collected
+        row = db.execute('SELECT parent_id FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        while row and row['parent_id'] is not None:
+            parent_id = row['parent_id']
+            db.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, lease_owner = NULL, lease_until = NULL, collected = 1, "
+                "updated_at = ? WHERE id = ?",
+                (error, now, parent_id)
+            )
+            row = db.execute('SELECT parent_id FROM jobs WHERE id = ?', (parent_id,)).fetchone()
+
+    def enqueue(self, stage: str, payload: Dict, idempotency_key: Optional[str] = None, priority: int = 0,
+                max_attempts: int = 3, delay: float = 0.0) -> Tuple[int, bool]:
+        """
+        Add a job; returns (job id, created). A repeated idempotency key returns the
+        existing job unless that job failed, in which case it is queued again
+        """
+        with self._transaction() as db:
+            return self._insert(db, stage, payload, idempotency_key, priority, max_attempts, delay)
+
+    def lease(self, worker_id: str, stages: Optional[Sequence[str]] = None,
+              lease_seconds: float = 600.0) -> Optional[Dict[str, Any]]:
+        """Claim the highest-priority ready job, or None if there is nothing to do"""
+        now = time.time()
+        with self._transaction() as db:
+            expired = db.execute(
+                "SELECT id, stage FROM jobs WHERE status = 'leased' AND lease_until < ? AND attempts >= max_attempts",
+                (now,)
+            ).fetchall()
+            for row in expired:
+                db.execute(
+                    "UPDATE jobs SET status = 'failed', error = 'Lease expired after final attempt', updated_at = ? "
+                    "WHERE id = ?",
+                    (now, row['id'])
+                )
+                self._fail_upstream(db, row['id'], f"Stage {row['stage']} failed: lease expired after final attempt", now)
+            query = (
+                "SELECT * FROM jobs WHERE ((status = 'queued' AND available_at <= ?) "
+                "OR (status = 'leased' AND lease_until < ?))"
+            )
+            params: List[Any] = [now, now]
+            if stages:
+                query += ' AND stage IN (%s)' % ','.join('?' * len(stages))
+                params.extend(stages)
+            row = db.execute(query + ' ORDER BY priority DESC, id LIMIT 1', params).fetchone()
+            if not row:
+                return None
+
+            db.execute(
+                "UPDATE jobs SET status = 'leased', attempts = attempts + 1, lease_owner = ?, lease_until = ?, "
+                "updated_at = ? WHERE id = ?",
+                (worker_id, now + lease_seconds, now, row['id'])
+            )
+            job = self._to_dict(row)
+            job['attempts'] += 1
+            return job
+
+    def heartbeat(self, job_id: int, worker_id: str, lease_seconds: float = 600.0) -> bool:
+        """Extend a lease; False means the job was reclaimed and the worker should stop"""
+        now = time.time()
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET lease_until = ?, updated_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (now + lease_seconds, now, job_id, worker_id)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, result: Any,
+                 next_jobs: Optional[List[Dict]] = None) -> bool:
+        """Finish a job and enqueue its follow-up stages in the same transaction"""
+        now = time.time()
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET status = 'done', result = ?, error = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (json.dumps(result, default=str), now, job_id, worker_id)
+            )
+            if cursor.rowcount != 1:
+                return False
+            for job in next_jobs or []:
+                self._insert(db, job['stage'], job['payload'], job.get('idempotency_key'),
+                             job.get('priority', 0), job.get('max_attempts', 3), job.get('delay', 0.0), job_id)
+            return True
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """Record a failure; the job is retried with exponential backoff until max_attempts"""
+        now = time.time()
+        with self._transaction() as db:
+            row = db.execute(
+                "SELECT stage, attempts, max_attempts FROM jobs WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (job_id, worker_id)
+            ).fetchone()
+            if not row:
+                return False
+            if row['attempts'] < row['max_attempts']:
+                delay = self.retry_delay * 2 ** (row['attempts'] - 1)
+                db.execute(
+                    "UPDATE jobs SET status = 'queued', error = ?, available_at = ?, lease_owner = NULL, "
+                    "lease_until = NULL, updated_at = ? WHERE id = ?",
+                    (error, now + delay, now, job_id)
+                )
+            else:
+                db.execute(
+                    "UPDATE jobs SET status = 'failed', error = ?, lease_until = NULL, updated_at = ? WHERE id = ?",
+                    (error, now, job_id)
+                )
+                self._fail_upstream(db, job_id, f"Stage {row['stage']} failed: {error}", now)
+            return True
+
+    def fail_chain(self, job_id: int, error: str) -> bool:
+        """
+        Mark a finished job and every stage upstream of it failed, e.g. when its result
+        could not be used, so the chain's idempotency key can be submitted again
+        """
+        now = time.time()
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, lease_owner = NULL, lease_until = NULL, collected = 1, "
+                "collect_until = NULL, updated_at = ? WHERE id = ? AND status IN ('done', 'failed')",
+                (error, now, job_id)
+            )
+            if cursor.rowcount != 1:
+                return False
+            self._fail_upstream(db, job_id, error, now)
+            return True
+
+    def collect(self, stages: Optional[Sequence[str]] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Hand over finished jobs until they are acknowledged: done jobs of the given
+        (final) stages and failed jobs of any stage
+        """
+        now = time.time()
+        with self._transaction() as db:
+            query = (
+                "SELECT * FROM jobs WHERE collected = 0 AND (collect_until IS NULL OR collect_until < ?) "
+                "AND (status = 'failed'"
+            )
+            params: List[Any] = [now]
+            if stages:
+                query += " OR (status = 'done' AND stage IN (%s))" % ','.join('?' * len(stages))
+                params.extend(stages)
+            else:
+                query += " OR status = 'done'"
+            rows = db.execute(query + ') ORDER BY id LIMIT ?', params + [limit]).fetchall()
+            db.executemany(
+                'UPDATE jobs SET collect_until = ? WHERE id = ?',
+                [(now + self.collect_timeout, row['id']) for row in rows]
+            )
+            return [self._to_dict(row) for row in rows]
+
+    def ack(self, job_ids: Sequence[int]) -> int:
+        """Confirm collected jobs were handled so they are not handed out again"""
+        with self._transaction() as db:
+            cursor = db.executemany(
+                "UPDATE jobs SET collected = 1, collect_until = NULL WHERE id = ? AND status IN ('done', 'failed')",
+                [(int(job_id),) for job_id in job_ids]
+            )
+            return cursor.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        rows = self._connection().execute('SELECT status, COUNT(*) AS count FROM jobs GROUP BY status').fetchall()
+        return {row['status']: row['count'] for row in rows}
+
+    def _to_dict(self, row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+
+def main():
+    """Main function for command line usage: job_queue.py <enqueue|collect|ack|fail|stats> '<json>'"""
+    if len(sys.argv) < 3:
+        print(json.dumps({"error": "Command and queue configuration required"}))
+        sys.exit(1)
+
+    try:
+        command = sys.argv[1]
+        config = json.loads(sys.argv[2])
+        queue = JobQueue(config['queue_path'], collect_timeout=config.get('collect_timeout', 600.0))
+
+        if command == 'enqueue':
+            job_id, created = queue.enqueue(
+                config['stage'], config.get('payload', {}),
+                idempotency_key=config.get('idempotency_key'),
+                priority=config.get('priority', 0),
+                max_attempts=config.get('max_attempts', 3)
+            )
+            result = {'success': True, 'job_id': job_id, 'created': created}
+        elif command == 'collect':
+            result = {'success': True, 'jobs': queue.collect(config.get('stages'), config.get('limit', 50))}
+        elif command == 'ack':
+            result = {'success': True, 'acknowledged': queue.ack(config.get('job_ids', []))}
+        elif command == 'fail':
+            result = {'success': queue.fail_chain(int(config['job_id']), config.get('error', 'Failed'))}
+        elif command == 'stats':
+            result = {'success': True, 'stats': queue.stats()}
+        else:
+            result = {'success': False, 'error': f"Unknown command: {command}"}
+
+        print(json.dumps(result, indent=2, default=str))
+
+    except Exception as e:
+        print(json.dumps({"success": False, "error": str(e)}))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Auto AI Studio Ollama Client
+Streaming, concurrent generation against a local Ollama server
+"""
+
+import sys
+import json
+import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from response_cache import ResponseCache, cache_key
+
+DEFAULT_OPTIONS = {
+    'temperature': 0.3,
+    'top_p': 0.8,
+    'max_tokens': 4000,
+    'num_predict': 4000
+}
+
+# Mirrors AutoAIStudioAIConnector::get_system_message()
+SYSTEM_MESSAGES = {
+    'general': 'You are a professional content writer. Create engaging, informative articles with proper structure, headings, and natural flow.',
+    'news': 'You are a news journalist. Write objective, factual news articles using inverted pyramid structure. Always cite sources when provided.',
+    'trending': 'You are a trending topics writer. Create engaging articles about current hot topics with a conversational tone that appeals to social media audiences.',
+    'listicle': 'You are a listicle writer. Create well-structured list articles with clear headings, engaging introductions, and actionable content.',
+    'multipage': 'You are a guide writer. Create comprehensive, multi-section guides with clear headings, step-by-step instructions, and practical examples.'
+}
+
+
+def build_content_prompt(topic: str, article_type: str, word_count: int, sources: Optional[List[Dict]] = None,
+                         research: Optional[Dict] = None) -> str:
+    """Mirrors AutoAIStudioAIConnector::build_content_prompt()"""
+    prompt = f"Write a {word_count}-word {article_type} article about: {topic}\n\n"
+
+    if research and research.get('context'):
+        prompt += "Use these research notes for reference (cite sources by their number):\n"
+        prompt += research['context'] + "\n\n"
+        prompt += "Sources:\n"
+        for citation in research.get('citations', []):
+            prompt += f"[{citation['id']}] {citation['title']} ({citation['url']})\n"
+        prompt += "\n"
+    elif sources:
+        prompt += "Use these sources for reference (cite them appropriately):\n"
+        for source in sources:
+            prompt += f"- {source['title']} ({source['url']})\n"
+            prompt += f"  Summary: {source['content'][:200]}...\n\n"
+
+    prompt += "Requirements:\n"
+    prompt += "- Use proper HTML headings (h2, h3) to structure the content\n"
+    prompt += "- Write engaging, informative content\n"
+    prompt += "- Include relevant keywords naturally\n"
+    prompt += "- Make it SEO-friendly but readable\n"
+    prompt += "- Add a compelling introduction and conclusion\n"
+
+    if article_type == 'news':
+        prompt += "- Follow news writing standards with inverted pyramid structure\n"
+        prompt += "- Include who, what, when, where, why in the first paragraph\n"
+        prompt += "- Cite sources appropriately\n"
+
+    if article_type == 'listicle':
+        prompt += "- Structure as a numbered list with detailed explanations\n"
+        prompt += "- Include practical tips and examples\n"
+
+    prompt += "\nWrite the complete article now:"
+    return prompt
+
+
+class OllamaClient:
+    def __init__(self, host: str = 'http://localhost:11434', model: str = 'llama3:8b',
+                 max_parallel: int = 4, keep_alive: str = '30m', timeout: int = 300,
+                 session: Optional[requests.Session] = None, cache: Optional[ResponseCache] = None):
+        self.host = host.rstrip('/')
+        self.model = model
+        # Should match the server's OLLAMA_NUM_PARALLEL; extra requests would only queue there
+        self.max_parallel = max(1, max_parallel)
+        self._slots = threading.BoundedSemaphore(self.max_parallel)
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.session.headers.update({'Content-Type': 'application/json'})
+        # Only steps that opt in with use_cache are replayed (titles, meta descriptions, keywords);
+        # article bodies and rewrites must stay fresh or a re-run campaign republishes the same text
+        self.cache = cache
+
+    def preload(self, model: Optional[str] = None) -> bool:
+        """Load the model into memory ahead of the first prompt"""
+        try:
+            response = self.session.post(
+                f"{self.host}/api/generate",
+                json={'model': model or self.model, 'keep_alive': self.keep_alive},
+                timeout=self.timeout
+            )
+            return response.status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+
+    def generate(self, prompt: str, model: Optional[str] = None, system: str = '',
+                 options: Optional[Dict] = None, on_token: Optional[Callable[[str], None]] = None,
+                 use_cache: bool = False) -> Dict[str, Any]:
+        """Stream one completion, passing each chunk to on_token as it arrives"""
+        model_name = model or self.model
+        options = {**DEFAULT_OPTIONS, **(options or {})}
+        data = {
+            'model': model_name,
+            'prompt': prompt,
+            'system': system,
+            'stream': True,
+            'keep_alive': self.keep_alive,
+            'options': options
+        }
+
+        key = None
+        if self.cache and use_cache:
+            key = cache_key(model_name, system, prompt, options)
+            cached = self.cache.get(key)
+            if cached:
+                if on_token:
+                    on_token(cached['content'])
+                return {**cached, 'cached': True}
+
+        try:
+            # Caps in-flight requests across every thread sharing this client
+            with self._slots, self.session.post(f"{self.host}/api/generate", json=data, stream=True, timeout=self.timeout) as response:
+                if response.status_code != 200:
+                    return {'success': False, 'error': f"HTTP Error: {response.status_code}"}
+
+                chunks = []
+                final = {}
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    message = json.loads(line)
+                    if message.get('error'):
+                        return {'success': False, 'error': message['error']}
+                    token = message.get('response', '')
+                    if token:
+                        chunks.append(token)
+                        if on_token:
+                            on_token(token)
+                    if message.get('done'):
+                        final = message
+                        break
+        except requests.exceptions.RequestException as e:
+            return {'success': False, 'error': str(e)}
+        except ValueError as e:
+            return {'success': False, 'error': f"JSON decode error: {e}"}
+
+        if not final:
+            return {'success': False, 'error': 'No response from AI model'}
+
+        eval_count = final.get('eval_count', 0)
+        eval_duration = final.get('eval_duration', 0)
+        result = {
+            'success': True,
+            'content': ''.join(chunks),
+            'model': model_name,
+            'eval_count': eval_count,
+            'eval_duration': eval_duration,
+            'prompt_eval_count': final.get('prompt_eval_count', 0),
+            'prompt_eval_duration': final.get('prompt_eval_duration', 0),
+            'tokens_per_second': eval_count / (eval_duration / 1e9) if eval_duration else 0.0
+        }
+        if key:
+            self.cache.put(key, result)
+        return result
+
+    def generate_many(self, batch: List[Dict]) -> List[Dict[str, Any]]:
+        """Run independent prompts concurrently; results keep the order of the requests"""
+        if not batch:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel, len(batch))) as executor:
+            futures = [
+                executor.submit(self.generate, r['prompt'], r.get('model'), r.get('system', ''), r.get('options'),
+                                None, r.get('cache', False))
+                for r in batch
+            ]
+            return [future.result() for future in futures]
+
+    def generate_article(self, topic: str, article_type: str = 'general', word_count: int = 800,
+                         sources: Optional[List[Dict]] = None, research: Optional[Dict] = None) -> Dict[str, Any]:
+        return self.generate(
+            build_content_prompt(topic, article_type, word_count, sources, research),
+            system=SYSTEM_MESSAGES.get(article_type, SYSTEM_MESSAGES['general']),
+            options={'temperature': 0.4, 'top_p': 0.9, 'max_tokens': word_count * 2}
+        )
+
+    def generate_article_extras(self, content: str, article_type: str = 'general',
+                                keyword_count: int = 10, humanize: bool = False) -> Dict[str, Any]:
+        """
+        Title, keywords and the optional humanize pass for one article in parallel,
+        then the meta description once a title is chosen (same prompts as the PHP connector)
+        """
+        steps = {
+            'titles': {
+                'system': 'You are an expert headline writer. Create compelling, SEO-friendly titles.',
+                'prompt': f"Based on this content, generate 3 different compelling titles for a {article_type} article. Make them engaging and click-worthy but not clickbait. Return only the titles, one per line:\n\n" + content[:500],
+                'options': {'temperature': 0.6, 'max_tokens': 200},
+                'cache': True
+            },
+            'keywords': {
+                'system': 'You are an SEO keyword expert. Extract relevant keywords and phrases.',
+                'prompt': f"Extract {keyword_count} SEO-relevant keywords from this content. Focus on terms people would search for. Return only keywords separated by commas:\n\n" + content[:1000],
+                'options': {'temperature': 0.2, 'max_tokens': 200},
+                'cache': True
+            }
+        }
+        if humanize:
+            steps['humanized'] = {
+                'system': 'You are an expert content editor. Make AI-generated content sound more human and natural while preserving all information.',
+                'prompt': "Rewrite this content to sound more human and natural. Keep all the information but make it flow better and sound less robotic. Maintain the same length and structure:\n\n" + content,
+                'options': {'temperature': 0.5, 'top_p': 0.9, 'max_tokens': len(content.split()) * 2}
+            }
+
+        results = dict(zip(steps.keys(), self.generate_many(list(steps.values()))))
+
+        titles = results['titles']
+        title = titles['content'].strip().split('\n')[0].strip() if titles['success'] else ''
+        results['meta_description'] = self.generate(
+            f"Create an SEO-optimized meta description (150-160 characters) for this article:\n\nTitle: {title}\n\nContent: " + content[:800] + "\n\nMeta description:",
+            system='You are an SEO expert. Create compelling meta descriptions for articles.',
+            options={'temperature': 0.4, 'max_tokens': 100},
+            use_cache=True
+        )
+        results['title'] = title
+        return results
+
+
+def main():
+    """Main function for command line usage"""
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "Generation configuration required"}))
+        sys.exit(1)
+
+    try:
+        config = json.loads(sys.argv[1])
+        client = OllamaClient(
+            host=config.get('host', 'http://localhost:11434'),
+            model=config.get('model', 'llama3:8b'),
+            max_parallel=config.get('max_parallel', 4),
+            keep_alive=config.get('keep_alive', '30m'),
+            cache=ResponseCache(config.get('cache_size', 1000), config.get('cache_path')) if config.get('cache_path') else None
+        )
+        results = client.generate_many(config.get('requests', []))
+
+        print(json.dumps({
+            'success': True,
+            'results': results,
+            'generated_at': datetime.now().isoformat()
+        }, indent=2))
+
+    except Exception as e:
+        print(json.dumps({"success": False, "error": str(e)}))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Auto AI Studio Paper Cache
+SQLite cache of Semantic Scholar paper metadata, abstract vectors and search results
+"""
+
+import os
+import json
+import time
+import sqlite3
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_PATH = os.environ.get('AUTO_AI_STUDIO_PAPER_CACHE') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'cache', 'papers.db'
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    paper_id TEXT NOT NULL,
+    model TEXT NOT NULL,
+    title TEXT,
+    abstract TEXT,
+    url TEXT,
+    publication_date TEXT,
+    vector BLOB,
+    vector_norm REAL NOT NULL,
+    ents TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (paper_id, model)
+);
+CREATE TABLE IF NOT EXISTS queries (
+    query TEXT NOT NULL,
+    model TEXT NOT NULL,
+    paper_ids TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (query, model)
+);
+"""
+
+
+def normalize_query(query: str) -> str:
+    return ' '.join(query.lower().split())
+
+
+class PaperCache:
+    """
+    Papers and search results are keyed by the NLP model that produced their
+    vectors, so a model upgrade never mixes vector spaces. Entries expire after ttl seconds.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, model: str = '', ttl: float = 7 * 86400):
+        self.model = model
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(SCHEMA)
+
+    def get_query(self, query: str) -> Optional[List[str]]:
+        """paperIds a previous search for this query scanned, in result order"""
+        row = self._db.execute(
+            'SELECT paper_ids FROM queries WHERE query = ? AND model = ? AND fetched_at > ?',
+            (normalize_query(query), self.model, time.time() - self.ttl)
+        ).fetchone()
+        return json.loads(row['paper_ids']) if row else None
+
+    def put_query(self, query: str, paper_ids: List[str]) -> None:
+        self._db.execute(
+            'INSERT OR REPLACE INTO queries (query, model, paper_ids, fetched_at) VALUES (?, ?, ?, ?)',
+            (normalize_query(query), self.model, json.dumps(paper_ids), time.time())
+        )
+        self._db.commit()
+
+    def get_papers(self, paper_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        if not paper_ids:
+            return {}
+        rows = self._db.execute(
+            'SELECT * FROM papers WHERE model = ? AND fetched_at > ? AND paper_id IN (%s)' % ','.join('?' * len(paper_ids)),
+            [self.model, time.time() - self.ttl] + list(paper_ids)
+        ).fetchall()
+        return {row['paper_id']: self._to_record(row) for row in rows}
+
+    def put_papers(self, records: List[Dict[str, Any]]) -> None:
+        now = time.time()
+        self._db.executemany(
+            'INSERT OR REPLACE INTO papers (paper_id, model, title, abstract, url, publication_date, vector, '
+            'vector_norm, ents, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            [(
+                r['paperId'], self.model, r['title'], r['abstract'], r['url'], r['publicationDate'],
+                r['vector'].astype('float32').tobytes() if r['vector'] is not None else None,
+                r['vector_norm'], json.dumps(r['ents']), now
+            ) for r in records]
+        )
+        self._db.commit()
+
+    def _to_record(self, row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            'paperId': row['paper_id'],
+            'title': row['title'],
+            'abstract': row['abstract'],
+            'url': row['url'],
+            'publicationDate': row['publication_date'],
+            'vector': np.frombuffer(row['vector'], dtype='float32') if row['vector'] else None,
+            'vector_norm': row['vector_norm'],
+            'ents': json.loads(row['ents'])
+        }
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Auto AI Studio Research Service
+Local JSON API around the content researcher and RSS processor
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger('auto_ai_studio.research_service')
+
+
+def _default_researcher():
+    from content_researcher import IntelligentContentResearcher
+    return IntelligentContentResearcher()
+
+
+def _default_rss_processor():
+    from rss_processor import RSSProcessor
+    return RSSProcessor()
+
+
+class ResearchService:
+    """Runs research and RSS requests on a bounded worker pool with per-request deadlines"""
+
+    def __init__(self, researcher_factory: Callable[[], Any] = _default_researcher,
+                 rss_factory: Callable[[], Any] = _default_rss_processor,
+                 max_concurrent: int = 2, max_queue: int = 8,
+                 default_deadline: float = 120.0, max_deadline: float = 600.0):
+        self.researcher_factory = researcher_factory
+        self.rss_factory = rss_factory
+        self.default_deadline = default_deadline
+        self.max_deadline = max_deadline
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrent, thread_name_prefix='research')
+        # Admission control: running plus waiting requests; anything beyond is rejected
+        self._slots = threading.BoundedSemaphore(max_concurrent + max_queue)
+        self._local = threading.local()
+
+    def _researcher(self):
+        # Providers hold sessions and per-run state, so each worker thread gets its own
+        if not hasattr(self._local, 'researcher'):
+            self._local.researcher = self.researcher_factory()
+        return self._local.researcher
+
+    def _rss_processor(self):
+        if not hasattr(self._local, 'rss_processor'):
+            self._local.rss_processor = self.rss_factory()
+        return self._local.rss_processor
+
+    def _research(self, payload: Dict) -> Dict:
+        return self._researcher().research_topic(
+            payload['topic'],
+            max_sources=payload.get('max_sources', 5),
+            context_tokens=payload.get('context_tokens', 800)
+        )
+
+    def _rss(self, payload: Dict) -> Dict:
+        return self._rss_processor().process_feeds(
+            payload.get('feeds', []),
+            payload.get('keywords', []),
+            payload.get('max_items', 10)
+        )
+
+    def handle(self, path: str, payload: Dict) -> Tuple[int, Dict]:
+        """Dispatch one request; returns (HTTP status, JSON body)"""
+        if path == '/research':
+            if not payload.get('topic'):
+                return 400, {'success': False, 'error': 'Topic is required'}
+            job = self._research
+        elif path == '/rss':
+            job = self._rss
+        else:
+            return 404, {'success': False, 'error': f"Unknown endpoint: {path}"}
+
+        try:
+            deadline = min(float(payload.get('deadline', self.default_deadline)), self.max_deadline)
+        except (TypeError, ValueError):
+            return 400, {'success': False, 'error': 'Invalid deadline'}
+
+        if not self._slots.acquire(blocking=False):
+            return 503, {'success': False, 'error': 'Service busy, try again later'}
+        future = self.executor.submit(job, payload)
+        future.add_done_callback(lambda f: self._slots.release())
+
+        try:
+            return 200, future.result(timeout=deadline)
+        except FutureTimeout:
+            # A queued job is dropped; a running one finishes in the background but keeps its slot
+            future.cancel()
+            logger.warning("%s exceeded its %gs deadline", path, deadline)
+            return 504, {'success': False, 'error': 'Deadline exceeded'}
+        except Exception as e:
+            logger.exception("%s failed", path)
+            return 500, {'success': False, 'error': str(e)}
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server_version = 'AutoAIStudioResearch/1.0'
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'success': True, 'status': 'ok'})
+        else:
+            self._send(404, {'success': False, 'error': f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            payload = json.loads(self.rfile.read(length) or b'{}')
+            if not isinstance(payload, dict):
+                raise ValueError('Request body must be a JSON object')
+        except ValueError as e:
+            self._send(400, {'success': False, 'error': f"Invalid JSON: {e}"})
+            return
+        status, body = self.server.service.handle(self.path, payload)
+        self._send(status, body)
+
+    def _send(self, status: int, body: Dict):
+        data = json.dumps(body, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Logs go to stderr only; unix socket peers have no address to report
+        logger.info(format, *args)
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def create_server(service: ResearchService, host: str = '127.0.0.1', port: int = 8765,
+                  socket_path: Optional[str] = None):
+    """HTTP server on a loopback port, or on a unix socket when socket_path is given"""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = UnixHTTPServer(socket_path, _RequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), _RequestHandler)
+        server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main():
+    """Main function for command line usage"""
+    parser = argparse.ArgumentParser(description='Auto AI Studio research service')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--socket', help='Listen on this unix socket instead of TCP')
+    parser.add_argument('--workers', type=int, default=2, help='Requests researched concurrently')
+    parser.add_argument('--queue', type=int, default=8, help='Requests allowed to wait for a worker')
+    parser.add_argument('--deadline', type=float, default=120.0, help='Default per-request deadline in seconds')
+    args = parser.parse_args()
+
+    logging.basicConfig(stream=sys.stderr, level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+
+    service = ResearchService(max_concurrent=args.workers, max_queue=args.queue, default_deadline=args.deadline)
+    server = create_server(service, args.host, args.port, args.socket)
+    logger.info("Research service listening on %s", args.socket or f"{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
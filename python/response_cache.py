@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Auto AI Studio Response Cache
+Content-addressed LRU cache for generation responses, optionally persisted to SQLite
+"""
+
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def cache_key(model: str, system: str, prompt: str, options: Optional[Dict] = None) -> str:
+    """Hash of everything that determines a generation's output"""
+    payload = json.dumps({
+        'model': model,
+        'system': system,
+        'prompt': prompt,
+        'options': options or {}
+    }, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int = 1000, path: Optional[str] = None):
+        self.max_entries = max(1, max_entries)
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, value TEXT NOT NULL, used_at REAL NOT NULL)'
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+            if self._db:
+                row = self._db.execute('SELECT value FROM responses WHERE key = ?', (key,)).fetchone()
+                if row:
+                    value = json.loads(row[0])
+                    self._db.execute('UPDATE responses SET used_at = ? WHERE key = ?', (time.time(), key))
+                    self._db.commit()
+                    self._remember(key, value)
+                    self.hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._remember(key, value)
+            if self._db:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO responses (key, value, used_at) VALUES (?, ?, ?)',
+                    (key, json.dumps(value), time.time())
+                )
+                # Same bound on disk as in memory, dropping the least recently used rows
+                self._db.execute(
+                    'DELETE FROM responses WHERE key NOT IN '
+                    '(SELECT key FROM responses ORDER BY used_at DESC LIMIT ?)',
+                    (self.max_entries,)
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, value: Dict[str, Any]) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+    def close(self) -> None:
+        if self._db:
+            self._db.close()
+            self._db = None
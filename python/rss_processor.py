@@ -8,9 +8,14 @@ import sys
 import json
 import requests
 import re
+import time
+import calendar
+import heapq
 from datetime import datetime
 from typing import List, Dict, Optional
 
+from ranking import RankingEngine, relevance_scorer, recency_scorer, credibility_scorer
+
 try:
     import xml.etree.ElementTree as ET
 except ImportError:
@@ -25,12 +30,13 @@ except ImportError:
 
 
 class RSSProcessor:
-    def __init__(self):
+    def __init__(self, ranking: Optional[RankingEngine] = None):
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (compatible; AutoAIStudio/1.0; +https://sawahsolutions.com)'
         })
         self.session.timeout = 30
+        self.ranking = ranking or RankingEngine()
     
     def process_feeds(self, feeds: List[Dict], keywords: List[str] = None, max_items: int = 10) -> Dict:
         """Process multiple RSS feeds and filter by keywords"""
@@ -53,15 +59,15 @@ class RSSProcessor:
                         'error': feed_items.get('error', 'Unknown error')
                     }
             
-            # Sort by relevance and date
+            # Select the top items by relevance and date
             if keywords:
-                all_items = self._rank_by_relevance(all_items, keywords)
+                top_items = self._rank_by_relevance(all_items, keywords, max_items)
             else:
-                all_items = sorted(all_items, key=lambda x: x.get('published', ''), reverse=True)
+                top_items = heapq.nlargest(max_items, all_items, key=lambda x: x.get('published_ts', 0))
             
             return {
                 'success': True,
-                'items': all_items[:max_items],
+                'items': top_items,
                 'total_feeds': len(feeds),
                 'total_items': len(all_items),
                 'feed_stats': feed_stats,
@@ -101,15 +107,19 @@ class RSSProcessor:
                     if keywords and not self._matches_keywords(title + ' ' + description, keywords):
                         continue
                     
-                    # Get published date
+                    # Get published date, parsed once into epoch seconds for ranking
                     published = ''
+                    published_ts = None
                     if hasattr(entry, 'published_parsed') and entry.published_parsed:
                         try:
                             published = datetime(*entry.published_parsed[:6]).isoformat()
+                            published_ts = calendar.timegm(entry.published_parsed[:6])
                         except:
                             published = datetime.now().isoformat()
                     else:
                         published = datetime.now().isoformat()
+                    if published_ts is None:
+                        published_ts = int(time.time())
                     
                     # Get author
                     author = getattr(entry, 'author', '') or ''
@@ -128,6 +138,7 @@ class RSSProcessor:
                         'description': description[:500],
                         'content': content[:2000],
                         'published': published,
+                        'published_ts': published_ts,
                         'author': author,
                         'source': feed['name'],
                         'source_url': feed['url'],
@@ -212,22 +223,9 @@ class RSSProcessor:
             return min(total_score / len(text.split()) * 100, 10.0)
         return 0.0
     
-    def _rank_by_relevance(self, items: List[Dict], keywords: List[str]) -> List[Dict]:
-        """Rank items by relevance and recency"""
-        def score_item(item):
-            relevance = item.get('relevance_score', 0)
-            
-            # Add recency bonus
-            try:
-                pub_date = datetime.fromisoformat(item['published'].replace('Z', '+00:00'))
-                hours_old = (datetime.now() - pub_date.replace(tzinfo=None)).total_seconds() / 3600
-                recency_bonus = max(0, (24 - hours_old) / 24) * 2
-            except:
-                recency_bonus = 0
-            
-            return relevance + recency_bonus
-        
-        return sorted(items, key=score_item, reverse=True)
+    def _rank_by_relevance(self, items: List[Dict], keywords: List[str], max_items: int = 10) -> List[Dict]:
+        """Select the top items by relevance and recency"""
+        return self.ranking.top_k(items, max_items, now=time.time())
 
 
 def main():
@@ -242,7 +240,11 @@ def main():
         keywords = config.get('keywords', [])
         max_items = config.get('max_items', 10)
         
-        processor = RSSProcessor()
+        scorers = [relevance_scorer(), recency_scorer(window_hours=config.get('recency_window_hours', 24))]
+        if config.get('credibility_weight'):
+            scorers.append(credibility_scorer(weight=config['credibility_weight']))
+        
+        processor = RSSProcessor(RankingEngine(scorers))
         result = processor.process_feeds(feeds, keywords, max_items)
         
         print(json.dumps(result, indent=2))
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite job queue
+Run from python/: python -m unittest discover tests
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_queue import JobQueue
+
+KEY = 'campaign-5-2026-01-01 10:00:00'
+
+
+class JobQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.queue = JobQueue(os.path.join(self.tmp, 'jobs.db'), retry_delay=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def run_research(self, payload):
+        job = self.queue.lease('worker', ['research'])
+        self.assertEqual(job['payload'], payload)
+        self.queue.complete(job['id'], 'worker', {}, [{
+            'stage': 'generate', 'payload': payload, 'idempotency_key': KEY + ':generate', 'max_attempts': 1
+        }])
+
+    def test_repeated_key_is_not_queued_twice(self):
+        self.assertEqual(self.queue.enqueue('research', {}, KEY), (1, True))
+        self.assertEqual(self.queue.enqueue('research', {}, KEY), (1, False))
+
+    def test_retries_until_max_attempts(self):
+        self.queue.enqueue('research', {}, KEY, max_attempts=2)
+
+        for attempt in (1, 2):
+            job = self.queue.lease('worker')
+            self.assertEqual(job['attempts'], attempt)
+            self.queue.fail(job['id'], 'worker', 'boom')
+
+        self.assertIsNone(self.queue.lease('worker'))
+        self.assertEqual(self.queue.stats(), {'failed': 1})
+
+    def test_failed_downstream_stage_releases_the_chain(self):
+        self.queue.enqueue('research', {'run': 1}, KEY)
+        self.run_research({'run': 1})
+        job = self.queue.lease('worker', ['generate'])
+        self.queue.fail(job['id'], 'worker', 'model offline')
+
+        # Only the failed stage is reported
+        collected = self.queue.collect(['generate'])
+        self.assertEqual([(j['stage'], j['status'], j['error']) for j in collected],
+                         [('generate', 'failed', 'model offline')])
+
+        # The next cron run can queue the same key again and both stages run
+        self.assertEqual(self.queue.enqueue('research', {'run': 2}, KEY), (1, True))
+        self.run_research({'run': 2})
+        job = self.queue.lease('worker', ['generate'])
+        self.assertEqual((job['payload'], job['attempts']), ({'run': 2}, 1))
+
+    def test_fail_chain_after_unusable_result(self):
+        self.queue.enqueue('research', {'run': 1}, KEY)
+        self.run_research({'run': 1})
+        job = self.queue.lease('worker', ['generate'])
+        self.queue.complete(job['id'], 'worker', {'title': 'Article'})
+        [done] = self.queue.collect(['generate'])
+
+        self.assertTrue(self.queue.fail_chain(done['id'], 'Failed to save post'))
+
+        self.assertEqual(self.queue.collect(['generate']), [])
+        self.assertEqual(self.queue.enqueue('research', {'run': 2}, KEY), (1, True))
+
+    def test_unacknowledged_results_are_collected_again(self):
+        self.queue.collect_timeout = 0.2
+        self.queue.enqueue('research', {'run': 1}, KEY)
+        self.run_research({'run': 1})
+        job = self.queue.lease('worker', ['generate'])
+        self.queue.complete(job['id'], 'worker', {'title': 'Article'})
+
+        [first] = self.queue.collect(['generate'])
+        self.assertEqual(self.queue.collect(['generate']), [])
+
+        # The collector died before saving; the result comes back once the collect lease lapses
+        time.sleep(0.3)
+        [second] = self.queue.collect(['generate'])
+        self.assertEqual(second['id'], first['id'])
+
+        self.assertEqual(self.queue.ack([second['id']]), 1)
+        time.sleep(0.3)
+        self.assertEqual(self.queue.collect(['generate']), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
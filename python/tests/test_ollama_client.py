@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the Ollama client against a local mock /api/generate server
+Run from python/: python -m unittest discover tests
+"""
+
+import os
+import sys
+import json
+import time
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ollama_client import OllamaClient
+from response_cache import ResponseCache
+
+
+class MockOllama:
+    """Streams NDJSON like Ollama's /api/generate and records request concurrency"""
+
+    def __init__(self, chunks=('Hello', ', ', 'world'), delay: float = 0.0,
+                 eval_count: int = 20, eval_duration: int = 2_000_000_000, error: str = ''):
+        self.chunks = chunks
+        self.delay = delay
+        self.eval_count = eval_count
+        self.eval_duration = eval_duration
+        self.error = error
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                with mock._lock:
+                    mock.requests.append(body)
+                    mock.active += 1
+                    mock.max_active = max(mock.max_active, mock.active)
+                try:
+                    time.sleep(mock.delay)
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/x-ndjson')
+                    self.end_headers()
+                    for chunk in mock.chunks:
+                        self._write({'model': body['model'], 'response': chunk, 'done': False})
+                    if mock.error:
+                        self._write({'error': mock.error})
+                        return
+                    self._write({'model': body['model'], 'response': '', 'done': True,
+                                 'eval_count': mock.eval_count, 'eval_duration': mock.eval_duration,
+                                 'prompt_eval_count': 5, 'prompt_eval_duration': 1000})
+                finally:
+                    with mock._lock:
+                        mock.active -= 1
+
+            def _write(self, message):
+                self.wfile.write((json.dumps(message) + '\n').encode('utf-8'))
+                self.wfile.flush()
+
+        return Handler
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class OllamaClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.mock = None
+
+    def tearDown(self):
+        if self.mock:
+            self.mock.close()
+
+    def client(self, **mock_options) -> OllamaClient:
+        self.mock = MockOllama(**mock_options)
+        return OllamaClient(host=self.mock.url, model='mock', max_parallel=2)
+
+    def test_streams_tokens_in_order(self):
+        client = self.client(chunks=('one ', 'two ', 'three'))
+        tokens = []
+
+        result = client.generate('prompt', on_token=tokens.append)
+
+        self.assertTrue(result['success'])
+        self.assertEqual(tokens, ['one ', 'two ', 'three'])
+        self.assertEqual(result['content'], 'one two three')
+        request = self.mock.requests[0]
+        self.assertTrue(request['stream'])
+        self.assertEqual(request['keep_alive'], client.keep_alive)
+
+    def test_tokens_per_second(self):
+        client = self.client(eval_count=50, eval_duration=2_500_000_000)
+
+        result = client.generate('prompt')
+
+        self.assertEqual(result['eval_count'], 50)
+        self.assertAlmostEqual(result['tokens_per_second'], 20.0)
+
+    def test_stream_error(self):
+        client = self.client(error='model not found')
+
+        result = client.generate('prompt')
+
+        self.assertFalse(result['success'])
+        self.assertEqual(result['error'], 'model not found')
+
+    def test_generate_many_keeps_request_order(self):
+        client = self.client(delay=0.05)
+
+        results = client.generate_many([{'prompt': f"prompt {i}"} for i in range(5)])
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(r['success'] for r in results))
+        self.assertEqual(sorted(r['prompt'] for r in self.mock.requests), [f"prompt {i}" for i in range(5)])
+
+    def test_concurrency_capped_at_max_parallel(self):
+        client = self.client(delay=0.2)
+
+        # Several threads sharing one client still stay within its max_parallel slots
+        threads = [
+            threading.Thread(target=client.generate_many, args=([{'prompt': f"{t}-{i}"} for i in range(3)],))
+            for t in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.mock.requests), 9)
+        self.assertEqual(self.mock.max_active, client.max_parallel)
+
+    def test_only_opted_in_steps_are_cached(self):
+        client = self.client()
+        client.cache = ResponseCache()
+
+        for _ in range(2):
+            article = client.generate_article('topic')
+            extras = client.generate_article_extras(article['content'], humanize=True)
+
+        # Article bodies and the humanize pass are regenerated; title, keywords and meta are replayed
+        self.assertFalse(article.get('cached'))
+        self.assertFalse(extras['humanized'].get('cached'))
+        self.assertTrue(extras['titles']['cached'])
+        self.assertTrue(extras['keywords']['cached'])
+        self.assertTrue(extras['meta_description']['cached'])
+        self.assertEqual(len(self.mock.requests), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the research service with stub research and RSS providers
+Run from python/: python -m unittest discover tests
+"""
+
+import os
+import sys
+import time
+import threading
+import unittest
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from research_service import ResearchService, create_server
+
+
+class StubResearcher:
+    """Returns immediately, or blocks until released when the topic is 'slow'"""
+
+    release = None
+
+    def research_topic(self, topic, max_sources=5, context_tokens=800):
+        if topic == 'slow':
+            StubResearcher.release.wait(5)
+        return {'success': True, 'topic': topic, 'sources': [], 'max_sources': max_sources}
+
+
+class StubRSSProcessor:
+    def process_feeds(self, feeds, keywords, max_items):
+        return {'success': True, 'items': [], 'feeds': feeds, 'max_items': max_items}
+
+
+class ResearchServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        StubResearcher.release = threading.Event()
+        self.service = ResearchService(StubResearcher, StubRSSProcessor, max_concurrent=1, max_queue=1,
+                                       default_deadline=5.0)
+        self.server = create_server(self.service, port=0)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        StubResearcher.release.set()
+        self.server.shutdown()
+        self.server.server_close()
+        self.service.close()
+
+    def post(self, path, payload=None, **kwargs):
+        return requests.post(self.url + path, json=payload, timeout=10, **kwargs)
+
+    def test_research(self):
+        response = self.post('/research', {'topic': 'solar power', 'max_sources': 3})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['topic'], 'solar power')
+        self.assertEqual(response.json()['max_sources'], 3)
+
+    def test_rss(self):
+        response = self.post('/rss', {'feeds': ['https://example.com/feed'], 'max_items': 4})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['max_items'], 4)
+
+    def test_health(self):
+        response = requests.get(self.url + '/health', timeout=10)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['status'], 'ok')
+
+    def test_bad_requests(self):
+        self.assertEqual(self.post('/research', {}).status_code, 400)
+        self.assertEqual(self.post('/research', {'topic': 'x', 'deadline': 'soon'}).status_code, 400)
+        self.assertEqual(self.post('/research', data=b'{not json').status_code, 400)
+        self.assertEqual(self.post('/research', ['topic']).status_code, 400)
+        self.assertEqual(self.post('/unknown', {}).status_code, 404)
+
+    def test_deadline_exceeded(self):
+        response = self.post('/research', {'topic': 'slow', 'deadline': 0.2})
+
+        self.assertEqual(response.status_code, 504)
+        self.assertFalse(response.json()['success'])
+
+    def test_busy_when_slots_are_full(self):
+        # One request running and one waiting fill max_concurrent + max_queue
+        for _ in range(2):
+            threading.Thread(target=self.post, args=('/research', {'topic': 'slow'}), daemon=True).start()
+        for _ in range(50):
+            if self.service._slots._value == 0:
+                break
+            time.sleep(0.05)
+
+        response = self.post('/research', {'topic': 'fast'})
+        self.assertEqual(response.status_code, 503)
+
+        # Slots are handed back once the running work finishes
+        StubResearcher.release.set()
+        for _ in range(50):
+            if self.service._slots._value == 2:
+                break
+            time.sleep(0.05)
+        self.assertEqual(self.post('/research', {'topic': 'fast'}).status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Auto AI Studio Vector Store
+Shares a spaCy model's word vectors between processes through a memory-mapped table
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+from collections.abc import Mapping
+from typing import Any, Iterator, Optional
+
+import numpy as np
+import spacy
+from spacy.vectors import Vectors
+
+DEFAULT_CACHE_DIR = os.environ.get('AUTO_AI_STUDIO_VECTOR_CACHE') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'cache', 'vectors'
+)
+
+
+def table_path(model_name: str, cache_dir: Optional[str] = None) -> str:
+    """Directory holding the exported table, keyed on model name and version"""
+    version = spacy.util.get_package_version(model_name) or 'local'
+    name = os.path.basename(str(model_name).rstrip('/\\'))
+    return os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"{name}-{version}")
+
+
+def export_vectors(vectors: Vectors, path: str) -> bool:
+    """Write a vector table to path as raw .npy files; returns True once the table exists"""
+    if os.path.exists(os.path.join(path, 'meta.json')):
+        return True
+    if vectors.mode != 'default' or not vectors.key2row:
+        return False
+
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=parent, prefix='.export-')
+    try:
+        np.save(os.path.join(tmp, 'vectors.npy'), np.ascontiguousarray(vectors.data, dtype='float32'))
+        count = len(vectors.key2row)
+        keys = np.fromiter(vectors.key2row.keys(), dtype='uint64', count=count)
+        rows = np.fromiter(vectors.key2row.values(), dtype='int64', count=count)
+        order = np.argsort(keys)
+        np.save(os.path.join(tmp, 'keys.npy'), keys[order])
+        np.save(os.path.join(tmp, 'rows.npy'), rows[order])
+        with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+            json.dump({'name': vectors.name, 'attr': vectors.attr, 'shape': list(vectors.shape)}, f)
+        # Publish atomically; if an overlapping process got there first, keep its copy
+        os.rename(tmp, path)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.exists(os.path.join(path, 'meta.json')):
+            raise
+    return True
+
+
+class MappedKeyIndex(Mapping):
+    """
+    Read-only stand-in for Vectors.key2row over sorted key and row arrays.
+    Lookups binary search the mapped keys, so no process builds a Python dict
+    with an entry per key (en_core_web_md has ~500k keys for ~20k rows).
+    """
+
+    def __init__(self, keys: np.ndarray, rows: np.ndarray):
+        self.keys_array = keys
+        self.rows_array = rows
+
+    def _find(self, key: Any) -> int:
+        try:
+            key = int(key)
+        except (TypeError, ValueError):
+            return -1
+        if not 0 <= key < 2 ** 64:
+            return -1
+        i = int(np.searchsorted(self.keys_array, np.uint64(key)))
+        if i < len(self.keys_array) and int(self.keys_array[i]) == key:
+            return int(self.rows_array[i])
+        return -1
+
+    def __getitem__(self, key: Any) -> int:
+        row = self._find(key)
+        if row < 0:
+            raise KeyError(key)
+        return row
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        row = self._find(key)
+        return row if row >= 0 else default
+
+    def __contains__(self, key: Any) -> bool:
+        return self._find(key) >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        return (int(key) for key in self.keys_array)
+
+    def __len__(self) -> int:
+        return len(self.keys_array)
+
+
+def attach_vectors(vocab: Any, path: str) -> None:
+    """Replace the vocab's vectors with a read-only memory map of an exported table"""
+    with open(os.path.join(path, 'meta.json')) as f:
+        meta = json.load(f)
+
+    data = np.load(os.path.join(path, 'vectors.npy'), mmap_mode='r')
+    keys = np.load(os.path.join(path, 'keys.npy'), mmap_mode='r')
+    rows = np.load(os.path.join(path, 'rows.npy'), mmap_mode='r')
+
+    vectors = Vectors(strings=vocab.strings, data=data, name=meta['name'], attr=meta['attr'])
+    vectors.key2row = MappedKeyIndex(keys, rows)
+    vocab.vectors = vectors
+
+
+def load_nlp(model_name: str, cache_dir: Optional[str] = None) -> Any:
+    """
+    Load a spaCy pipeline whose vectors are mapped from a shared table.
+    The first process to run exports the table; later ones skip deserializing the vectors.
+    """
+    path = table_path(model_name, cache_dir)
+
+    if os.path.exists(os.path.join(path, 'meta.json')):
+        try:
+            nlp = spacy.load(model_name, exclude=['vectors'])
+            attach_vectors(nlp.vocab, path)
+            return nlp
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Vector Table Error: {e}", file=sys.stderr)
+
+    nlp = spacy.load(model_name)
+    try:
+        if export_vectors(nlp.vocab.vectors, path):
+            # Swap to the mapped copy so this process's private one can be freed
+            attach_vectors(nlp.vocab, path)
+    except (OSError, ValueError) as e:
+        print(f"Vector Table Export Error: {e}", file=sys.stderr)
+    return nlp